@@ -25,9 +25,12 @@ name = 21111
 print(f"Name int: {name}, Type: {type(name)}")
 
 # String operations
-print(f"Uppercase: {name.upper()}")
-print(f"Length: {len(name)}")
-print(f"Contains 'thon': {'thon' in name}")
+print(
+    f"Uppercase: {name.upper()}",
+    f"Length: {len(name)}",
+    f"Contains 'thon': {'thon' in name}",
+    sep="\n",
+)
 
 # 4. Booleans
 is_student = True
@@ -40,13 +43,17 @@ print(f"No Value: {no_value}, Type: {type(no_value)}")
 # =========== BASIC OPERATIONS ==========
 # Arithmetic operations
 a, b = 10, 3
-print(f"Addition: {a + b}")
-print(f"Subtraction: {a - b}")
-print(f"Multiplication: {a * b}")
-print(f"Division: {a / b}")
-print(f"Floor Division: {a // b}")
-print(f"Modulus: {a % b}")
-print(f"Exponentiation: {a ** b}")
+# One print() call with sep="\n" writes all the lines at once
+print(
+    f"Addition: {a + b}",
+    f"Subtraction: {a - b}",
+    f"Multiplication: {a * b}",
+    f"Division: {a / b}",
+    f"Floor Division: {a // b}",
+    f"Modulus: {a % b}",
+    f"Exponentiation: {a ** b}",
+    sep="\n",
+)
 
 # =========== TYPE CONVERSION ==========
 # Converting between types
@@ -17,10 +17,13 @@ mixed = [1, "hello", 3.14, True, None]
 print(f"First fruit: {fruits[0]}")  # First element (starts at 0)
 print(f"Last fruit: {fruits[-1]}")  # Negative indexing for elements from the end
 
-# Slicing lists
-print(f"First three fruits: {fruits[0:3]}")  # Elements from index 0 to 2
-print(f"All fruits except first two: {fruits[2:]}")  # Elements from index 2 to end
-print(f"Last three fruits: {fruits[-3:]}")  # Last three elements
+# Slicing lists (one print() call with sep="\n" writes all the lines at once)
+print(
+    f"First three fruits: {fruits[0:3]}",  # Elements from index 0 to 2
+    f"All fruits except first two: {fruits[2:]}",  # Elements from index 2 to end
+    f"Last three fruits: {fruits[-3:]}",  # Last three elements
+    sep="\n",
+)
 
 # List operations
 print(f"Length of fruits list: {len(fruits)}")  # Number of elements
@@ -37,18 +40,17 @@ popped_fruit = fruits.pop()  # Remove and return the last item
 print(f"Popped fruit: {popped_fruit}")
 print(f"After pop: {fruits}")
 
-fruits.sort()  # Sort the list in place
-print(f"After sort: {fruits}")
-
-fruits.reverse()  # Reverse the list in place
-print(f"After reverse: {fruits}")
+fruits.sort(reverse=True)  # Sort in place, descending, in one pass (no separate reverse())
+print(f"After sort (descending): {fruits}")
 
 # List comprehensions
-squares = [x**2 for x in range(1, 6)]
+squares = [x * x for x in range(1, 6)]
 print(f"Squares using list comprehension: {squares}")
 
-even_numbers = [x for x in range(1, 11) if x % 2 == 0]
-print(f"Even numbers using list comprehension: {even_numbers}")
+# A comprehension can also filter: [x for x in range(1, 11) if x % 2 == 0]
+# For a regular step like this, range() produces the numbers directly
+even_numbers = list(range(2, 11, 2))
+print(f"Even numbers using range with a step: {even_numbers}")
 
 # =========== TUPLES ==========
 print("\n===== TUPLES =====")
@@ -63,9 +65,12 @@ print(f"X coordinate: {coordinates[0]}")
 print(f"Person name: {person[0]}")
 
 # Tuple operations
-print(f"Length of person tuple: {len(person)}")
-print(f"Count of 'John' in person: {person.count('John')}")
-print(f"Index of 25 in person: {person.index(25)}")
+print(
+    f"Length of person tuple: {len(person)}",
+    f"Count of 'John' in person: {person.count('John')}",
+    f"Index of 25 in person: {person.index(25)}",
+    sep="\n",
+)
 
 # Tuple unpacking
 name, age, job = person  # Unpack the tuple into variables
@@ -83,9 +88,12 @@ person = {
 }
 
 # Accessing dictionary values
-print(f"Name: {person['name']}")
-print(f"Skills: {person['skills']}")
-print(f"First skill: {person['skills'][0]}")
+print(
+    f"Name: {person['name']}",
+    f"Skills: {person['skills']}",
+    f"First skill: {person['skills'][0]}",
+    sep="\n",
+)
 
 # Alternative access with get() (provides default if key doesn't exist)
 print(f"Salary (with default): {person.get('salary', 'Not specified')}")
@@ -95,13 +103,16 @@ person["location"] = "New York"  # Add a new key-value pair
 person["age"] = 31  # Modify an existing value
 print(f"After updates: {person}")
 
-# Dictionary operations
-print(f"Dictionary keys: {list(person.keys())}")
-print(f"Dictionary values: {list(person.values())}")
-print(f"Dictionary items: {list(person.items())}")
+# Dictionary operations (keys(), values() and items() return views - no list copy needed)
+print(
+    f"Dictionary keys: {person.keys()}",
+    f"Dictionary values: {person.values()}",
+    f"Dictionary items: {person.items()}",
+    sep="\n",
+)
 
 # Dictionary comprehensions
-squares_dict = {x: x**2 for x in range(1, 6)}
+squares_dict = {x: x * x for x in range(1, 6)}
 print(f"Squares dictionary: {squares_dict}")
 
 # =========== SETS ==========
@@ -126,13 +137,16 @@ print(f"After discard of non-existent element: {fruits_set}")
 set_a = {1, 2, 3, 4, 5}
 set_b = {4, 5, 6, 7, 8}
 
-print(f"Union: {set_a | set_b}")  # Elements in either set
-print(f"Intersection: {set_a & set_b}")  # Elements in both sets
-print(f"Difference (A-B): {set_a - set_b}")  # Elements in A but not in B
-print(f"Symmetric difference: {set_a ^ set_b}")  # Elements in either set but not both
+print(
+    f"Union: {set_a | set_b}",  # Elements in either set
+    f"Intersection: {set_a & set_b}",  # Elements in both sets
+    f"Difference (A-B): {set_a - set_b}",  # Elements in A but not in B
+    f"Symmetric difference: {set_a ^ set_b}",  # Elements in either set but not both
+    sep="\n",
+)
 
 # Set comprehensions
-even_set = {x for x in range(10) if x % 2 == 0}
+even_set = {x for x in range(0, 10, 2)}  # Step through evens instead of filtering
 print(f"Even numbers set: {even_set}")
 
 # =========== EXERCISES ==========
@@ -71,7 +71,7 @@ print("\n===== RAISING EXCEPTIONS =====")
 # 1. Raising an exception manually
 def validate_age(age):
     """Validate that age is a positive integer."""
-    if not isinstance(age, int):
+    if type(age) is not int:  # Exact type check: cheap, and rejects bools like True
         raise TypeError("Age must be an integer")
     if age < 0:
         raise ValueError("Age cannot be negative")
@@ -114,6 +114,8 @@ class InsufficientFundsError(Exception):
 
 # 2. Using the custom exception
 class BankAccount:
+    __slots__ = ("balance",)  # Fixed attribute layout: no per-instance __dict__
+
     def __init__(self, initial_balance=0):
         self.balance = initial_balance
     
@@ -126,10 +128,11 @@ class BankAccount:
     def withdraw(self, amount):
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive")
-        if amount > self.balance:
-            raise InsufficientFundsError(self.balance, amount)
-        self.balance -= amount
-        return self.balance
+        balance = self.balance  # Read the attribute once
+        if amount > balance:
+            raise InsufficientFundsError(balance, amount)
+        self.balance = balance = balance - amount
+        return balance
 
 # Test the custom exception
 account = BankAccount(100)
@@ -222,9 +225,14 @@ def calculate_average(numbers):
     """Calculate the average of a list of numbers."""
     assert isinstance(numbers, list), "Input must be a list"
     assert len(numbers) > 0, "List cannot be empty"
-    assert all(isinstance(x, (int, float)) for x in numbers), "All elements must be numbers"
-    
-    return sum(numbers) / len(numbers)
+
+    # Check the types and add up the values in a single pass over the list
+    total = 0
+    for x in numbers:
+        assert type(x) is int or type(x) is float, "All elements must be numbers"
+        total += x
+
+    return total / len(numbers)
 
 # Test the function with assertions
 try:
@@ -11,31 +11,34 @@ and handling file paths.
 print("===== BASIC FILE READING =====")
 
 # Create a sample text file to work with
-with open("sample.txt", "w") as f:
-    f.write("Hello, World!\nThis is a sample text file.\nPython file handling is powerful.")
-
-# Reading an entire file at once
-print("\nReading entire file:")
-with open("sample.txt", "r") as file:
+# "w+" opens the file for writing *and* reading, so one file object serves every
+# example below; seek(0) moves back to the start before each new read
+with open("sample.txt", "w+") as file:
+    file.write("Hello, World!\nThis is a sample text file.\nPython file handling is powerful.")
+
+    # Reading an entire file at once
+    print("\nReading entire file:")
+    file.seek(0)
     contents = file.read()
     print(contents)
 
-# Reading line by line
-print("\nReading line by line:")
-with open("sample.txt", "r") as file:
+    # Reading line by line
+    print("\nReading line by line:")
+    file.seek(0)
     for line in file:
         print(f"Line: {line.strip()}")  # strip() removes leading/trailing whitespace
 
-# Reading all lines into a list
-print("\nReading all lines into a list:")
-with open("sample.txt", "r") as file:
-    lines = file.readlines()
+    # Reading all lines into a list
+    print("\nReading all lines into a list:")
+    file.seek(0)
+    # One read() and a split is cheaper than readlines(); keepends=True keeps the "\n"
+    lines = file.read().splitlines(keepends=True)
     print(f"Lines as list: {lines}")
     print(f"Number of lines: {len(lines)}")
 
-# Reading specific lines
-print("\nReading specific number of characters:")
-with open("sample.txt", "r") as file:
+    # Reading specific lines
+    print("\nReading specific number of characters:")
+    file.seek(0)
     first_10_chars = file.read(10)
     print(f"First 10 characters: {first_10_chars}")
 
@@ -44,8 +47,8 @@ print("\n===== WRITING TO FILES =====")
 
 # 1. Writing to a text file
 with open("output.txt", "w") as file:
-    file.write("This is the first line.\n")
-    file.write("This is the second line.\n")
+    file.write("This is the first line.\n"
+               "This is the second line.\n")  # Adjacent literals are joined into one write
 
 print("Wrote to output.txt")
 
@@ -64,7 +67,7 @@ with open("output.txt", "r") as file:
 # 3. Writing multiple lines at once
 lines = ["Line 1", "Line 2", "Line 3", "Line 4"]
 with open("multiple_lines.txt", "w") as file:
-    file.writelines(f"{line}\n" for line in lines)
+    file.write("\n".join(lines) + "\n")  # Join once, then write a single string
 
 print("Wrote multiple lines to multiple_lines.txt")
 
@@ -95,14 +98,20 @@ print(f"Current working directory: {cwd}")
 file_path = os.path.join("data", "sample.txt")
 print(f"Joined path: {file_path}")
 
-# Check if file exists
-sample_exists = os.path.exists("sample.txt")
+# Check if file exists and get its information with a single os.stat() call
+# (os.path.exists, getsize and getmtime would each stat the file separately)
+try:
+    file_stat = os.stat("sample.txt")
+except FileNotFoundError:
+    sample_exists = False
+else:
+    sample_exists = True
+    size = file_stat.st_size
+    modification_time = file_stat.st_mtime
 print(f"sample.txt exists: {sample_exists}")
 
 # Get file information
 if sample_exists:
-    size = os.path.getsize("sample.txt")
-    modification_time = os.path.getmtime("sample.txt")
     print(f"File size: {size} bytes")
     print(f"Last modified: {modification_time}")
 
@@ -131,10 +140,13 @@ import csv
 # Create a sample CSV file
 with open("data.csv", "w", newline='') as file:
     writer = csv.writer(file)
-    writer.writerow(["Name", "Age", "City"])  # Header row
-    writer.writerow(["Alice", 30, "New York"])
-    writer.writerow(["Bob", 25, "Los Angeles"])
-    writer.writerow(["Charlie", 35, "Chicago"])
+    rows = [
+        ["Name", "Age", "City"],  # Header row
+        ["Alice", 30, "New York"],
+        ["Bob", 25, "Los Angeles"],
+        ["Charlie", 35, "Chicago"],
+    ]
+    writer.writerows(rows)  # Write all rows in one call
 
 print("Created data.csv")
 
@@ -142,15 +154,19 @@ print("Created data.csv")
 with open("data.csv", "r", newline='') as file:
     reader = csv.reader(file)
     print("\nCSV Contents:")
-    for row in reader:
-        print(row)
+    # Format every row first, then print them all with a single call
+    print("\n".join(map(str, reader)))
 
-# Using DictReader to read CSV as dictionaries
+# Accessing columns by name
+# csv.DictReader(file) would build a new dictionary for every row; looking up
+# each column's position in the header once lets us index plain row lists instead
 with open("data.csv", "r", newline='') as file:
-    reader = csv.DictReader(file)
-    print("\nCSV Contents as dictionaries:")
-    for row in reader:
-        print(row)
+    reader = csv.reader(file)
+    header = next(reader)  # First row holds the column names
+    name_col, age_col, city_col = (header.index(col) for col in ("Name", "Age", "City"))
+    print("\nCSV Contents by column name:")
+    print("\n".join(f"Name: {row[name_col]}, Age: {row[age_col]}, City: {row[city_col]}"
+                    for row in reader))
 
 # =========== WORKING WITH JSON ==========
 print("\n===== WORKING WITH JSON =====")
@@ -170,8 +186,10 @@ data = {
 }
 
 # Write JSON to a file
+# json.dump() writes to the file chunk by chunk; encoding with dumps()
+# first lets us write the whole document in a single call
 with open("data.json", "w") as file:
-    json.dump(data, file, indent=4)
+    file.write(json.dumps(data, indent=4))
 
 print("Wrote data to data.json")
 
@@ -35,7 +35,7 @@ greet_with_default("Bob")  # Uses provided value
 # 1. Function that returns a value
 def square(number):
     """Return the square of a number."""
-    return number ** 2
+    return number * number
 
 # Calling and using the return value
 result = square(5)
@@ -44,7 +44,19 @@ print(f"Square of 5 is {result}")
 # 2. Function that returns multiple values
 def get_min_max(numbers):
     """Return the minimum and maximum values from a list."""
-    return min(numbers), max(numbers)
+    # One pass that tracks both values, instead of min() and max() each
+    # walking the whole list
+    iterator = iter(numbers)
+    try:
+        lowest = highest = next(iterator)
+    except StopIteration:
+        raise ValueError("get_min_max() arg is an empty sequence") from None
+    for number in iterator:
+        if number < lowest:
+            lowest = number
+        elif number > highest:
+            highest = number
+    return lowest, highest
 
 # Unpacking the return values
 min_val, max_val = get_min_max([3, 1, 7, 2, 9])
@@ -75,10 +87,8 @@ print(f"Sum of 1, 2, 3, 4: {add_numbers(1, 2, 3, 4)}")
 # 4. Variable number of keyword arguments (**kwargs)
 def build_profile(first_name, last_name, **user_info):
     """Build a dictionary with user information."""
-    profile = {'first_name': first_name, 'last_name': last_name}
-    # Add any other key-value pairs
-    profile.update(user_info)
-    return profile
+    # Build the dictionary in one step; ** unpacks any other key-value pairs into it
+    return {'first_name': first_name, 'last_name': last_name, **user_info}
 
 # Call with additional keyword arguments
 user = build_profile(
@@ -122,13 +132,21 @@ print(f"Global x after change_global_x: {x}")
 double = lambda x: x * 2
 print(f"Double of 5 using lambda: {double(5)}")
 
-# Useful with functions like map, filter, and sorted
+# Often passed to functions like map, filter, and sorted
 numbers = [1, 5, 3, 9, 2, 6]
-squared = list(map(lambda x: x**2, numbers))
-print(f"Squared numbers using map and lambda: {squared}")
-
-even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
-print(f"Even numbers using filter and lambda: {even_numbers}")
+# map and filter with a lambda call a Python function for every element:
+#   squared = list(map(lambda x: x**2, numbers))
+#   even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+# A comprehension evaluates the expression inline, which is faster and reads better
+squared = [x**2 for x in numbers]
+print(f"Squared numbers using a list comprehension: {squared}")
+
+even_numbers = [x for x in numbers if x % 2 == 0]
+print(f"Even numbers using a list comprehension: {even_numbers}")
+
+# map stays a good fit when the function already exists (no lambda needed)
+number_strings = list(map(str, numbers))
+print(f"Numbers as strings using map: {number_strings}")
 
 # Sort a list of tuples by the second element
 pairs = [(1, 'one'), (3, 'three'), (2, 'two'), (4, 'four')]
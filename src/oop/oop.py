@@ -5,6 +5,9 @@ Object-Oriented Programming (OOP) in Python
 This file covers classes, objects, inheritance, encapsulation, and polymorphism.
 """
 
+from itertools import accumulate
+from math import pi, tau  # tau == 2 * pi
+
 # =========== CLASSES AND OBJECTS ==========
 # 1. Basic class definition
 class Dog:
@@ -13,6 +16,10 @@ class Dog:
     # Class variable (shared by all instances)
     species = "Canis familiaris"
     
+    # __slots__ lists the instance attributes up front, so Python stores them
+    # in fixed slots instead of a per-instance __dict__ (smaller, faster objects)
+    __slots__ = ("name", "age")
+    
     # Constructor method (initialize instance variables)
     def __init__(self, name, age):
         """Initialize name and age attributes."""
@@ -47,6 +54,8 @@ print(miles.speak("Bark!"))
 class Animal:
     """A simple class to represent animals."""
     
+    __slots__ = ("name", "age")
+    
     def __init__(self, name, age):
         """Initialize name and age attributes."""
         self.name = name
@@ -60,6 +69,8 @@ class Animal:
 class Cat(Animal):
     """A class representing a cat, inherits from Animal."""
     
+    __slots__ = ("color",)  # name and age slots are inherited from Animal
+    
     def __init__(self, name, age, color):
         """
         Initialize attributes of the parent class and add a new attribute.
@@ -97,6 +108,8 @@ print(whiskers.purr())
 class Flyable:
     """A mixin class for flyable things."""
     
+    __slots__ = ()  # Mixins declare empty slots so subclasses can stay slotted
+    
     def fly(self):
         """Method to fly."""
         return f"{self.__class__.__name__} is flying..."
@@ -104,6 +117,8 @@ class Flyable:
 class Swimmable:
     """A mixin class for swimmable things."""
     
+    __slots__ = ()
+    
     def swim(self):
         """Method to swim."""
         return f"{self.__class__.__name__} is swimming..."
@@ -111,6 +126,8 @@ class Swimmable:
 class Duck(Animal, Flyable, Swimmable):
     """A duck can both fly and swim."""
     
+    __slots__ = ()
+    
     def make_sound(self):
         """Override the make_sound method."""
         return "Quack!"
@@ -127,6 +144,8 @@ print(donald.swim())        # From Swimmable
 class BankAccount:
     """A class to represent a bank account with encapsulation."""
     
+    __slots__ = ("owner", "__balance")  # "__balance" is name-mangled here too
+    
     def __init__(self, owner, balance=0):
         """Initialize with owner and optional starting balance."""
         self.owner = owner
@@ -146,6 +165,20 @@ class BankAccount:
             return True
         return False
     
+    def apply_transactions(self, deltas):
+        """Apply a batch of deposits (+) and withdrawals (-) all at once.
+
+        Either every transaction is applied or, if the balance would go
+        negative at any point, none of them are.
+        """
+        # accumulate() and min() do the per-transaction work in C, and the
+        # attribute is read and written once instead of once per transaction
+        running = list(accumulate(deltas, initial=self.__balance))
+        if min(running) < 0:
+            return False
+        self.__balance = running[-1]
+        return True
+    
     def get_balance(self):
         """Getter method for balance."""
         return self.__balance
@@ -169,12 +202,17 @@ account.deposit(500)
 print(account.get_balance())
 account.withdraw(200)
 print(account.get_balance())
+print(account.apply_transactions([100, -300, 50]))  # True: balance stays positive
+print(account.apply_transactions([-5000, 6000]))    # False: nothing is applied
+print(account.get_balance())
 print(account)  # Uses __str__ method
 
 # =========== POLYMORPHISM ==========
 class Shape:
     """Base class for shapes."""
     
+    __slots__ = ()
+    
     def area(self):
         """Calculate the area of the shape."""
         pass
@@ -186,6 +224,8 @@ class Shape:
 class Rectangle(Shape):
     """A class for rectangles."""
     
+    __slots__ = ("width", "height")
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -199,16 +239,16 @@ class Rectangle(Shape):
 class Circle(Shape):
     """A class for circles."""
     
+    __slots__ = ("radius",)
+    
     def __init__(self, radius):
         self.radius = radius
     
     def area(self):
-        import math
-        return math.pi * self.radius ** 2
+        return pi * self.radius * self.radius
     
     def perimeter(self):
-        import math
-        return 2 * math.pi * self.radius
+        return tau * self.radius
 
 # Function that demonstrates polymorphism
 def print_shape_info(shape):
@@ -5,9 +5,18 @@ This file demonstrates building a RESTful API with FastAPI and SQLite,
 implementing CRUD operations for a simple user management system.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status
-from pydantic import BaseModel, EmailStr, Field
+from fastapi import FastAPI, HTTPException, Depends, Body, Query, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+import atexit
+import json
+import os
+import queue
+import re
 import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from typing import List, Optional
 import uvicorn
 
@@ -21,30 +30,110 @@ app = FastAPI(
 # Database setup and helper functions
 DB_PATH = 'users.db'
 
-def get_db_connection():
-    """Create a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # This enables column access by name: row['column_name']
+# SQL statements used by the endpoints. Keeping each one as a single fixed string
+# means sqlite3's per-connection statement cache (keyed by the SQL text) always
+# hits, so a pooled connection parses every statement only once.
+# Column order shared by every query that returns users:
+USER_COLUMNS = "id, username, email, age, created_at"
+SQL_INSERT = f"INSERT INTO users (username, email, age) VALUES (?, ?, ?) RETURNING {USER_COLUMNS}"
+# SQLite allows 999 "?" parameters per statement by default (newer builds allow
+# more); at 3 columns per user that is 333 rows per bulk INSERT
+USERS_PER_INSERT = 999 // 3
+MAX_BULK_USERS = 1000  # Larger bulk requests are rejected with 422
+# Keyset pagination: "id > ?" seeks straight to the page through the primary
+# key, unlike OFFSET, which steps over every skipped row. LIMIT -1 means no limit.
+SQL_SELECT_PAGE = f"SELECT {USER_COLUMNS} FROM users WHERE id > ? ORDER BY id LIMIT ?"
+SQL_SELECT_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = ?"
+SQL_DELETE = "DELETE FROM users WHERE id = ? RETURNING id"
+
+@lru_cache(maxsize=None)  # Only a few column combinations are possible
+def build_update_sql(columns):
+    """
+    Return the UPDATE statement that sets the given columns of one user.
+
+    Each combination is built once, so the same text reaches sqlite3 every
+    time and its statement cache can reuse the parsed query.
+    """
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE users SET {assignments} WHERE id = ? RETURNING {USER_COLUMNS}"
+
+# Idle connections kept open for reuse, so requests don't pay for opening
+# the database file every time
+_connection_pool = queue.SimpleQueue()
+
+# Settings that apply per connection, so every new pooled connection runs them once
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",   # In WAL mode, only sync at checkpoints, not every commit
+    "mmap_size=268435456",  # Read pages through a 256 MB memory map, without extra copies
+    "cache_size=-65536",    # ~64 MB page cache (negative means KiB) instead of ~2 MB
+    "temp_store=MEMORY",    # Keep temporary tables and indexes (sorts) in RAM
+    "foreign_keys=ON",      # Enforce REFERENCES constraints (off by default in SQLite)
+)
+
+def _connect():
+    """Open a new connection to the SQLite database."""
+    # Rows come back as plain tuples: queries list their columns in USER_COLUMNS
+    # order, and row_to_user() maps the positions onto the User model
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,  # Pooled connections move between threads
+        cached_statements=256,  # Parsed statements kept per connection (default 128)
+    )
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
     return conn
 
+@contextmanager
+def get_db_connection():
+    """
+    Borrow a connection from the pool for the duration of a with block.
+
+    The transaction is committed when the block succeeds and rolled back if it
+    raises, then the connection goes back to the pool.
+    """
+    try:
+        conn = _connection_pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        _connection_pool.put(conn)
+
+@atexit.register
+def close_db_connections():
+    """Close all pooled connections when the process exits."""
+    while True:
+        try:
+            _connection_pool.get_nowait().close()
+        except queue.Empty:
+            break
+
 def init_db():
     """Initialize the database with the users table if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Create users table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT NOT NULL UNIQUE,
-        email TEXT NOT NULL,
-        age INTEGER,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Write-ahead logging: commits append to a log instead of rewriting a
+        # rollback journal, and readers no longer block behind writers.
+        # The setting is stored in the database file, so it only needs to run once.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
+        # Create users table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL UNIQUE,
+            email TEXT NOT NULL,
+            age INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
     
-    conn.commit()
-    conn.close()
     print("Database initialized successfully!")
 
 # Initialize the database when this module is imported
@@ -54,21 +143,41 @@ init_db()
 # DATA MODELS (PYDANTIC MODELS)
 # ==============================
 
+# A light "name@domain.tld" shape check, compiled once at import. It replaces
+# EmailStr, whose full RFC parser (email-validator) ran on every request.
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+def check_email(email):
+    """Raise ValueError unless email looks like an email address (None is allowed)."""
+    if email is not None and not EMAIL_RE.fullmatch(email):
+        raise ValueError("value is not a valid email address")
+    return email
+
 class UserBase(BaseModel):
     """Base model with common user attributes."""
     username: str = Field(..., min_length=3, max_length=50, example="johndoe")
-    email: EmailStr = Field(..., example="john@example.com")
+    email: str = Field(..., example="john@example.com")
     age: Optional[int] = Field(None, ge=0, le=120, example=30)
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, email):
+        return check_email(email)
+
 class UserCreate(UserBase):
     """Model for creating a new user."""
     pass
 
 class UserUpdate(BaseModel):
     """Model for updating a user (all fields optional)."""
-    email: Optional[EmailStr] = Field(None, example="newemail@example.com")
+    email: Optional[str] = Field(None, example="newemail@example.com")
     age: Optional[int] = Field(None, ge=0, le=120, example=31)
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, email):
+        return check_email(email)
+
 class User(UserBase):
     """Model for a user retrieved from the database."""
     id: int
@@ -78,13 +187,44 @@ class User(UserBase):
         """Configure Pydantic to work with ORM models."""
         orm_mode = True
 
+def row_to_user(row):
+    """
+    Build a User from a row tuple in USER_COLUMNS order.
+
+    model_construct() skips validation: the values come straight from our own
+    table, which only ever stores validated input.
+    """
+    return User.model_construct(
+        id=row[0], username=row[1], email=row[2], age=row[3], created_at=row[4]
+    )
+
+# JSON serializers for the response types, built once at import. Endpoints
+# return their result already encoded, so FastAPI doesn't re-validate and
+# serialize it against response_model on every request. response_model is
+# still declared on the routes so the API docs show the schema.
+USER_ADAPTER = TypeAdapter(User)
+USER_LIST_ADAPTER = TypeAdapter(List[User])
+
+def json_response(adapter, value, status_code=status.HTTP_200_OK):
+    """Serialize value with a prebuilt TypeAdapter into a JSON Response."""
+    return Response(
+        content=adapter.dump_json(value),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
 # ==============================
 # API ENDPOINTS (CRUD OPERATIONS)
 # ==============================
 
+# The endpoints are plain "def" functions because sqlite3 calls block.
+# FastAPI runs "def" endpoints in its worker thread pool, which keeps the
+# event loop free to serve other requests while one waits on the database.
+# Use "async def" only when every call inside is awaitable.
+
 # Create a new user (CREATE)
 @app.post("/api/users", response_model=User, status_code=status.HTTP_201_CREATED)
-async def create_user(user: UserCreate):
+def create_user(user: UserCreate):
     """
     Create a new user with the provided details.
     
@@ -93,21 +233,14 @@ async def create_user(user: UserCreate):
     - **age**: Optional - Age between 0-120
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO users (username, email, age) VALUES (?, ?, ?)",
-            (user.username, user.email, user.age)
-        )
-        conn.commit()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            # RETURNING hands back the new row from the INSERT itself,
+            # so no second SELECT is needed
+            cursor.execute(SQL_INSERT, (user.username, user.email, user.age))
+            new_user = row_to_user(cursor.fetchone())
         
-        # Get the newly created user
-        user_id = cursor.lastrowid
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        new_user = dict(cursor.fetchone())
-        conn.close()
-        
-        return new_user
+        return json_response(USER_ADAPTER, new_user, status.HTTP_201_CREATED)
     except sqlite3.IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -119,18 +252,103 @@ async def create_user(user: UserCreate):
             detail=str(e)
         )
 
+# Create many users at once (CREATE)
+@app.post("/api/users/bulk", response_model=List[User], status_code=status.HTTP_201_CREATED)
+def create_users_bulk(users: List[UserCreate] = Body(..., max_length=MAX_BULK_USERS)):
+    """
+    Create several users in a single request and a single transaction.
+
+    - **users**: A list of up to 1000 users, each with the same fields as a single create
+
+    Either every user is created or, if any username is already taken, none are.
+    """
+    if not users:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No users provided"
+        )
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            new_users = []
+            # Each INSERT carries up to USERS_PER_INSERT rows in one VALUES list,
+            # and all of them share the connection's single commit
+            for start in range(0, len(users), USERS_PER_INSERT):
+                chunk = users[start:start + USERS_PER_INSERT]
+                placeholders = ", ".join(["(?, ?, ?)"] * len(chunk))
+                cursor.execute(
+                    f"INSERT INTO users (username, email, age) VALUES {placeholders} "
+                    f"RETURNING {USER_COLUMNS}",
+                    [value for u in chunk for value in (u.username, u.email, u.age)]
+                )
+                # RETURNING doesn't promise an order, but AUTOINCREMENT IDs grow
+                # with each row, so sorting by id lines them up with the chunk
+                new_users.extend(row_to_user(row) for row in sorted(cursor.fetchall()))
+
+        return json_response(USER_LIST_ADAPTER, new_users, status.HTTP_201_CREATED)
+    except sqlite3.IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="One or more usernames already exist"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+# Rows read from the database per step while streaming the user list
+STREAM_BATCH_SIZE = 1000
+
+# Compact JSON encoder built once (json.dumps with extra options builds a new
+# encoder on every call). ensure_ascii=False writes non-ASCII text as UTF-8,
+# the same as the single-user endpoints, instead of \u escapes.
+encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+def stream_users_json(after_id=0, limit=-1):
+    """
+    Yield users with an id above after_id (at most limit of them, -1 for all)
+    as a JSON array, piece by piece.
+
+    Only STREAM_BATCH_SIZE rows are held in memory at a time. The first piece,
+    "[", is yielded after the query has run, so advancing the generator once
+    surfaces database errors before any response is sent.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(SQL_SELECT_PAGE, (after_id, limit))
+        yield "["
+        separator = ""
+        while batch := cursor.fetchmany(STREAM_BATCH_SIZE):
+            # Same key order as the User model's own JSON output
+            yield separator + ",".join(
+                encode_json({"username": row[1], "email": row[2], "age": row[3],
+                             "id": row[0], "created_at": row[4]})
+                for row in batch
+            )
+            separator = ","
+        yield "]"
+
 # Get all users (READ)
+# response_model still documents the schema; returning a Response directly
+# sends the streamed body as-is
 @app.get("/api/users", response_model=List[User])
-async def get_all_users():
-    """Retrieve all users from the database."""
+def get_all_users(
+    after_id: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+):
+    """
+    Retrieve users from the database, ordered by ID.
+    
+    - **after_id**: Optional - Only return users with a higher ID (pass the last ID of the previous page)
+    - **limit**: Optional - Maximum number of users to return (1-1000); all users if omitted
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users")
-        users = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        chunks = stream_users_json(after_id, -1 if limit is None else limit)
+        first_chunk = next(chunks)  # Runs the query now, inside this try
         
-        return users
+        return StreamingResponse(chain([first_chunk], chunks), media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -139,18 +357,17 @@ async def get_all_users():
 
 # Get a single user by ID (READ)
 @app.get("/api/users/{user_id}", response_model=User)
-async def get_user(user_id: int):
+def get_user(user_id: int):
     """
     Retrieve a specific user by their ID.
     
     - **user_id**: The ID of the user to retrieve
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        user = cursor.fetchone()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_SELECT_BY_ID, (user_id,))
+            user = cursor.fetchone()
         
         if not user:
             raise HTTPException(
@@ -158,7 +375,7 @@ async def get_user(user_id: int):
                 detail="User not found"
             )
         
-        return dict(user)
+        return json_response(USER_ADAPTER, row_to_user(user))
     except HTTPException:
         raise  # Re-raise HTTPExceptions for proper error handling
     except Exception as e:
@@ -169,7 +386,7 @@ async def get_user(user_id: int):
 
 # Update a user (UPDATE)
 @app.put("/api/users/{user_id}", response_model=User)
-async def update_user(user_id: int, user_update: UserUpdate):
+def update_user(user_id: int, user_update: UserUpdate):
     """
     Update an existing user's information.
     
@@ -178,7 +395,7 @@ async def update_user(user_id: int, user_update: UserUpdate):
     - **age**: Optional - New age between 0-120
     """
     # Check if any fields are provided for update
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
     if not update_data:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -186,44 +403,36 @@ async def update_user(user_id: int, user_update: UserUpdate):
         )
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Collect the columns to update and their new values
+            update_fields = []
+            params = []
+            
+            if 'email' in update_data:
+                update_fields.append("email")
+                params.append(update_data['email'])
+            
+            if 'age' in update_data:
+                update_fields.append("age")
+                params.append(update_data['age'])
+            
+            # Complete the parameter list with the user_id
+            params.append(user_id)
+            
+            # Perform the update and get the updated user in one statement;
+            # no row comes back if the user doesn't exist
+            cursor.execute(build_update_sql(tuple(update_fields)), params)
+            updated_user = cursor.fetchone()
         
-        # First check if the user exists
-        cursor.execute("SELECT 1 FROM users WHERE id = ?", (user_id,))
-        if not cursor.fetchone():
-            conn.close()
+        if not updated_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        # Build the dynamic part of the SQL query
-        update_fields = []
-        params = []
-        
-        if 'email' in update_data:
-            update_fields.append("email = ?")
-            params.append(update_data['email'])
-        
-        if 'age' in update_data:
-            update_fields.append("age = ?")
-            params.append(update_data['age'])
-        
-        # Complete the parameter list with the user_id
-        params.append(user_id)
-        
-        # Perform the update
-        query = f"UPDATE users SET {', '.join(update_fields)} WHERE id = ?"
-        cursor.execute(query, params)
-        conn.commit()
-        
-        # Get the updated user
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        updated_user = dict(cursor.fetchone())
-        conn.close()
-        
-        return updated_user
+        return json_response(USER_ADAPTER, row_to_user(updated_user))
     except HTTPException:
         raise  # Re-raise HTTPExceptions for proper error handling
     except Exception as e:
@@ -234,30 +443,26 @@ async def update_user(user_id: int, user_update: UserUpdate):
 
 # Delete a user (DELETE)
 @app.delete("/api/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(user_id: int):
+def delete_user(user_id: int):
     """
     Delete a user by their ID.
     
     - **user_id**: The ID of the user to delete
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Delete the user; RETURNING tells us whether a row was removed
+            cursor.execute(SQL_DELETE, (user_id,))
+            deleted = cursor.fetchone()
         
-        # First check if the user exists
-        cursor.execute("SELECT 1 FROM users WHERE id = ?", (user_id,))
-        if not cursor.fetchone():
-            conn.close()
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        # Delete the user
-        cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        conn.commit()
-        conn.close()
-        
         # Return no content on successful deletion
         return None
     except HTTPException:
@@ -301,5 +506,11 @@ if __name__ == '__main__':
     print("- Swagger UI: http://127.0.0.1:8000/docs")
     print("- ReDoc: http://127.0.0.1:8000/redoc")
     
-    # Start the FastAPI application with Uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
\ No newline at end of file
+    # Start the FastAPI application with Uvicorn.
+    # workers=N runs one server process per CPU core, so requests are served in
+    # parallel without sharing a GIL. Worker processes import the app themselves,
+    # which is why it is passed as the "module:attribute" string (run from this
+    # directory, as run_app.sh does). loop and http are left on "auto": Uvicorn
+    # picks uvloop and httptools when they are installed (uvicorn[standard]).
+    uvicorn.run("app:app", host="127.0.0.1", port=8000,
+                workers=os.cpu_count(), log_level="warning")
\ No newline at end of file
@@ -10,7 +10,7 @@ echo "Activating virtual environment..."
 source "$PROJECT_DIR/venv/bin/activate"
 
 echo "Installing required packages if needed..."
-pip install fastapi uvicorn pydantic email-validator
+pip install fastapi "uvicorn[standard]" pydantic
 
 echo "Starting FastAPI application..."
 cd "$SCRIPT_DIR"
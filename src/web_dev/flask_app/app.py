@@ -6,38 +6,127 @@ implementing CRUD operations for a simple user management system.
 """
 
 from flask import Flask, request, jsonify
+import atexit
+import queue
 import sqlite3
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 
 app = Flask(__name__)
+# Don't sort every dictionary's keys while encoding JSON; responses keep the
+# column order the queries return them in
+app.json.sort_keys = False
 
 # Database setup and helper functions
 DB_PATH = 'users.db'
 
-def get_db_connection():
-    """Create a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # This enables column access by name: row['column_name']
+# SQL statements used by the endpoints. Keeping each one as a single fixed string
+# means sqlite3's per-connection statement cache (keyed by the SQL text) always
+# hits, so a pooled connection parses every statement only once.
+# Queries name the columns they return rather than using SELECT *, so adding a
+# column to the table doesn't silently make every response bigger
+USER_COLUMNS = "id, username, email, age, created_at"
+USER_FIELDS = tuple(USER_COLUMNS.split(", "))  # The same names, as dictionary keys
+SQL_INSERT = "INSERT INTO users (username, email, age) VALUES (?, ?, ?)"
+# Keyset pagination: "id > ?" seeks straight to the page through the primary
+# key, unlike OFFSET, which steps over every skipped row. LIMIT -1 means no limit.
+SQL_SELECT_PAGE = f"SELECT {USER_COLUMNS} FROM users WHERE id > ? ORDER BY id LIMIT ?"
+SQL_SELECT_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = ?"
+SQL_DELETE = "DELETE FROM users WHERE id = ?"
+
+@lru_cache(maxsize=None)  # Only a few column combinations are possible
+def build_update_sql(columns):
+    """
+    Return the UPDATE statement that sets the given columns of one user.
+
+    Each combination is built once, so the same text reaches sqlite3 every
+    time and its statement cache can reuse the parsed query.
+    """
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE users SET {assignments} WHERE id = ?"
+
+# Idle connections kept open for reuse, so requests don't pay for opening
+# the database file every time
+_connection_pool = queue.SimpleQueue()
+
+# Settings that apply per connection, so every new pooled connection runs them once
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",   # In WAL mode, only sync at checkpoints, not every commit
+    "mmap_size=268435456",  # Read pages through a 256 MB memory map, without extra copies
+    "cache_size=-65536",    # ~64 MB page cache (negative means KiB) instead of ~2 MB
+    "temp_store=MEMORY",    # Keep temporary tables and indexes (sorts) in RAM
+    "foreign_keys=ON",      # Enforce REFERENCES constraints (off by default in SQLite)
+)
+
+def _connect():
+    """Open a new connection to the SQLite database."""
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,  # Pooled connections move between threads
+        cached_statements=256,  # Parsed statements kept per connection (default 128)
+    )
+    # Rows come back as plain tuples (no row_factory): user queries list their
+    # columns in USER_COLUMNS order, and user_to_dict() pairs them with the names
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
     return conn
 
+@contextmanager
+def get_db_connection():
+    """
+    Borrow a connection from the pool for the duration of a with block.
+
+    The transaction is committed when the block succeeds and rolled back if it
+    raises, then the connection goes back to the pool.
+    """
+    try:
+        conn = _connection_pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        _connection_pool.put(conn)
+
+@atexit.register
+def close_db_connections():
+    """Close all pooled connections when the process exits."""
+    while True:
+        try:
+            _connection_pool.get_nowait().close()
+        except queue.Empty:
+            break
+
+def user_to_dict(row):
+    """Turn a user row tuple (in USER_COLUMNS order) into a dictionary."""
+    return dict(zip(USER_FIELDS, row))
+
 def init_db():
     """Initialize the database with the users table if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Create users table
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT NOT NULL UNIQUE,
-        email TEXT NOT NULL,
-        age INTEGER,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    ''')
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Write-ahead logging: commits append to a log instead of rewriting a
+        # rollback journal, and readers no longer block behind writers.
+        # The setting is stored in the database file, so it only needs to run once.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
+        # Create users table
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL UNIQUE,
+            email TEXT NOT NULL,
+            age INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
     
-    conn.commit()
-    conn.close()
     print("Database initialized successfully!")
 
 # Initialize the database when this module is imported
@@ -67,17 +156,12 @@ def create_user():
         return jsonify({"error": "Username and email are required"}), 400
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO users (username, email, age) VALUES (?, ?, ?)",
-            (data['username'], data['email'], data.get('age'))
-        )
-        conn.commit()
-        
-        # Get the ID of the newly created user
-        user_id = cursor.lastrowid
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_INSERT, (data['username'], data['email'], data.get('age')))
+            
+            # Get the ID of the newly created user
+            user_id = cursor.lastrowid
         
         return jsonify({
             "message": "User created successfully",
@@ -92,13 +176,32 @@ def create_user():
 # Get all users (READ)
 @app.route('/api/users', methods=['GET'])
 def get_all_users():
-    """Retrieve all users from the database."""
+    """
+    Retrieve users from the database, ordered by ID.
+    
+    Optional query parameters:
+    - after_id: only return users with a higher ID (the last ID of the previous page)
+    - limit: maximum number of users to return (1-1000); all users if omitted
+    """
+    # Parse the parameters explicitly: request.args.get(..., type=int) would
+    # quietly fall back to the default for a value like "abc"
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users")
-        users = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        after_id = int(request.args.get('after_id', 0))
+        limit = int(request.args['limit']) if 'limit' in request.args else None
+    except ValueError:
+        valid = False
+    else:
+        valid = after_id >= 0 and (limit is None or 1 <= limit <= 1000)
+    if not valid:
+        return jsonify({"error": "after_id must be >= 0 and limit between 1 and 1000"}), 400
+    if limit is None:
+        limit = -1  # LIMIT -1: no limit
+    
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_SELECT_PAGE, (after_id, limit))
+            users = [user_to_dict(row) for row in cursor.fetchall()]
         
         return jsonify({"users": users}), 200
     except Exception as e:
@@ -109,14 +212,13 @@ def get_all_users():
 def get_user(user_id):
     """Retrieve a specific user by their ID."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        user = cursor.fetchone()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SQL_SELECT_BY_ID, (user_id,))
+            user = cursor.fetchone()
         
         if user:
-            return jsonify({"user": dict(user)}), 200
+            return jsonify({"user": user_to_dict(user)}), 200
         else:
             return jsonify({"error": "User not found"}), 404
     except Exception as e:
@@ -139,16 +241,16 @@ def update_user(user_id):
     if not data:
         return jsonify({"error": "No data provided for update"}), 400
     
-    # Build the dynamic part of the SQL query
+    # Collect the columns to update and their new values
     update_fields = []
     params = []
     
     if 'email' in data:
-        update_fields.append("email = ?")
+        update_fields.append("email")
         params.append(data['email'])
     
     if 'age' in data:
-        update_fields.append("age = ?")
+        update_fields.append("age")
         params.append(data['age'])
     
     if not update_fields:
@@ -158,21 +260,17 @@ def update_user(user_id):
     params.append(user_id)
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Perform the update; rowcount is 0 if the user doesn't exist,
+            # so no separate existence check is needed
+            cursor.execute(build_update_sql(tuple(update_fields)), params)
+            updated = cursor.rowcount
         
-        # First check if the user exists
-        cursor.execute("SELECT 1 FROM users WHERE id = ?", (user_id,))
-        if not cursor.fetchone():
-            conn.close()
+        if not updated:
             return jsonify({"error": "User not found"}), 404
         
-        # Perform the update
-        query = f"UPDATE users SET {', '.join(update_fields)} WHERE id = ?"
-        cursor.execute(query, params)
-        conn.commit()
-        conn.close()
-        
         return jsonify({"message": "User updated successfully"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -182,20 +280,16 @@ def update_user(user_id):
 def delete_user(user_id):
     """Delete a user by their ID."""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Delete the user; rowcount tells us whether a row was removed
+            cursor.execute(SQL_DELETE, (user_id,))
+            deleted = cursor.rowcount
         
-        # First check if the user exists
-        cursor.execute("SELECT 1 FROM users WHERE id = ?", (user_id,))
-        if not cursor.fetchone():
-            conn.close()
+        if not deleted:
             return jsonify({"error": "User not found"}), 404
         
-        # Delete the user
-        cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        conn.commit()
-        conn.close()
-        
         return jsonify({"message": "User deleted successfully"}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -229,5 +323,9 @@ if __name__ == '__main__':
     print("- PUT /api/users/<id> - Update a user")
     print("- DELETE /api/users/<id> - Delete a user")
     
-    # Start the Flask application in debug mode
-    app.run(debug=True)
\ No newline at end of file
+    # Start Flask's built-in server. It is multi-threaded, but debug mode stays
+    # off unless FLASK_DEBUG=1 is set: the reloader and debugger watch files
+    # and slow every request, and the debugger must never be exposed publicly.
+    # For production, serve the app with a WSGI server instead, e.g.:
+    #   gunicorn -w $((2 * $(nproc) + 1)) -k gthread --threads 4 app:app
+    app.run()
\ No newline at end of file
@@ -10,46 +10,225 @@ This module demonstrates SQLite database operations in Python, including:
 
 import sqlite3
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import wraps
+from inspect import signature
+from itertools import chain, groupby
+
+# ===============================
+# ERROR HANDLING
+# ===============================
+
+def sqlite_guard(message, default=None, integrity_message=None):
+    """
+    Decorator that handles database errors the same way for every function.
+    
+    If the decorated function raises sqlite3.Error, the error is printed after
+    message and default is returned instead. A callable default (such as list)
+    is called to give a fresh value each time, so callers never share one list.
+    For a constraint violation (sqlite3.IntegrityError), integrity_message is
+    printed instead when given, filled in with the function's arguments,
+    e.g. "Error: Username '{username}' already exists".
+    
+    Inside a "with transaction(conn):" block (conn being the first argument)
+    the error is raised instead, so the block rolls back as a whole rather
+    than committing the writes that did succeed.
+    
+    Args:
+        message (str): Text printed before the error, e.g. "Error inserting user"
+        default: Value (or callable producing the value) returned on error
+        integrity_message (str): Optional format string printed for
+            sqlite3.IntegrityError instead of message and the error
+    """
+    def decorator(func):
+        func_signature = signature(func)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except sqlite3.Error as e:
+                if args and in_transaction_block(args[0]):
+                    raise
+                if integrity_message and isinstance(e, sqlite3.IntegrityError):
+                    arguments = func_signature.bind(*args, **kwargs).arguments
+                    print(integrity_message.format(**arguments))
+                else:
+                    print(f"{message}: {e}")
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
 
 # ===============================
 # DATABASE SETUP AND CONNECTION
 # ===============================
 
-def create_connection(db_file="example.db"):
+@sqlite_guard("Error connecting to database")
+def create_connection(db_file="example.db", check_same_thread=True):
     """
     Create a connection to an SQLite database.
     Creates the database file if it doesn't exist.
     
     Args:
         db_file (str): Path to the database file
+        check_same_thread (bool): Only allow the creating thread to use the
+            connection (pass False for connections shared between threads)
         
     Returns:
         sqlite3.Connection: Database connection object or None on error
     """
+    # Create directory if it doesn't exist
+    os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
+    
+    # Connect to the database (will create it if it doesn't exist).
+    # sqlite3 keeps parsed statements per connection, keyed by the exact SQL
+    # text; a larger cache (default 128) lets every fixed query stay parsed.
+    conn = sqlite3.connect(
+        db_file,
+        cached_statements=256,
+        check_same_thread=check_same_thread,
+    )
+    
+    # Enable foreign key constraints
+    conn.execute("PRAGMA foreign_keys = ON")
+    
+    # Performance settings (they apply to this connection only)
+    conn.execute("PRAGMA synchronous = NORMAL")    # Fewer fsyncs; safe with WAL
+    conn.execute("PRAGMA temp_store = MEMORY")     # Temporary tables and sorts in RAM
+    conn.execute("PRAGMA cache_size = -65536")     # ~64 MB page cache (negative = KiB)
+    conn.execute("PRAGMA mmap_size = 268435456")   # Read through a 256 MB memory map
+    
+    # Write-ahead logging lets readers keep working while a write commits,
+    # and each commit appends to the log instead of syncing a rollback journal.
+    # An in-memory database has no file to log to, so it is skipped there.
+    if db_file != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
+    
+    # Set row_factory to access columns by name. Query results are returned
+    # as these Row objects directly: row['email'] works just like a
+    # dictionary, without building a dict for every row (use dict(row)
+    # when a real dictionary is needed, e.g. for JSON)
+    conn.row_factory = sqlite3.Row
+    
+    print(f"Connected to SQLite database: {db_file}")
+    return conn
+
+# How many "with transaction(conn):" blocks are open on each connection, keyed
+# by id(conn) (sqlite3 connections can't take attributes or weak references).
+# conn.in_transaction can't be used for this: sqlite3 also opens a transaction
+# on its own for any INSERT/UPDATE/DELETE run outside these blocks.
+_transaction_depth = {}
+
+def in_transaction_block(conn):
+    """Return True while conn is inside a "with transaction(conn):" block."""
+    return id(conn) in _transaction_depth
+
+@contextmanager
+def transaction(conn):
+    """
+    Run the statements of a with block as one transaction.
+    
+    BEGIN IMMEDIATE takes the write lock up front, so the block can't fail
+    halfway with "database is locked". The transaction is committed when the
+    block finishes and rolled back if it raises. The helpers in this file
+    raise their sqlite3.Error inside the block (see sqlite_guard), so a failed
+    write rolls back the writes before it too.
+    
+    Writes made earlier outside any transaction() block are still pending in
+    the transaction sqlite3 opened for them; they are committed first, so
+    they don't end up inside this block.
+    
+    Inside another transaction() block on the same connection (say,
+    insert_users_bulk called within "with transaction(conn):"), the block runs
+    in a savepoint instead: an error undoes just the block, and the outer
+    transaction decides whether everything is committed.
+    
+    Args:
+        conn (sqlite3.Connection): Database connection
+    """
+    key = id(conn)
+    depth = _transaction_depth.get(key, 0)
+    if depth:
+        conn.execute("SAVEPOINT nested_transaction")
+    else:
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+    _transaction_depth[key] = depth + 1
     try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(db_file) or '.', exist_ok=True)
-        
-        # Connect to the database (will create it if it doesn't exist)
-        conn = sqlite3.connect(db_file)
-        
-        # Enable foreign key constraints
-        conn.execute("PRAGMA foreign_keys = ON")
-        
-        # Set row_factory to access columns by name
-        conn.row_factory = sqlite3.Row
-        
-        print(f"Connected to SQLite database: {db_file}")
+        yield conn
+    except BaseException:
+        if depth:
+            conn.execute("ROLLBACK TO nested_transaction")
+        else:
+            conn.rollback()
+        raise
+    else:
+        if not depth:
+            conn.commit()
+    finally:
+        if depth:
+            conn.execute("RELEASE nested_transaction")
+            _transaction_depth[key] = depth
+        else:
+            del _transaction_depth[key]
+
+class SqlitePool:
+    """
+    A connection pool for multi-threaded programs: one writer and several readers.
+    
+    In WAL mode each reader sees a consistent snapshot and never waits for the
+    writer, so reads on different connections run side by side. SQLite only
+    allows one writer at a time anyway, so all writes share a single connection
+    behind a lock instead of competing for the database's write lock.
+    """
+    
+    def __init__(self, db_file, readers=4):
+        """Open the writer and reader connections (keep readers small, e.g. 2-8)."""
+        self._writer = self._open(db_file)
+        self._write_lock = threading.Lock()
+        self._readers = queue.SimpleQueue()
+        for _ in range(readers):
+            self._readers.put(self._open(db_file))
+        self._reader_count = readers
+    
+    @staticmethod
+    def _open(db_file):
+        conn = create_connection(db_file, check_same_thread=False)
+        if conn is None:
+            raise sqlite3.OperationalError(f"Could not open database: {db_file}")
         return conn
-    except sqlite3.Error as e:
-        print(f"Error connecting to database: {e}")
-        return None
+    
+    @contextmanager
+    def reader(self):
+        """Borrow a reader connection (waits if all of them are in use)."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    @contextmanager
+    def writer(self):
+        """Use the writer connection; the with block runs as one transaction."""
+        with self._write_lock, transaction(self._writer):
+            yield self._writer
+    
+    def close(self):
+        """Close every connection in the pool."""
+        with self._write_lock:
+            self._writer.close()
+        for _ in range(self._reader_count):
+            self._readers.get().close()
 
 # ===============================
 # TABLE CREATION AND MANAGEMENT
 # ===============================
 
+@sqlite_guard("Error creating tables")
 def create_tables(conn):
     """
     Create the necessary tables for our example.
@@ -57,42 +236,125 @@ def create_tables(conn):
     Args:
         conn (sqlite3.Connection): Database connection
     """
-    try:
-        cursor = conn.cursor()
-        
-        # Create users table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT NOT NULL UNIQUE,
-            email TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    cursor = conn.cursor()
+    
+    # Create users table
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL UNIQUE,
+        email TEXT NOT NULL,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    
+    # Create posts table with foreign key reference to users
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS posts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        published_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+    )
+    ''')
+    
+    # SQLite doesn't index foreign key columns on its own. This index lets
+    # "WHERE user_id = ?", the posts-per-user JOIN and ON DELETE CASCADE
+    # find a user's posts without scanning the whole table.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_posts_user_id ON posts (user_id)"
+    )
+    
+    # Full-text index over the posts' title and content, used by
+    # search_posts_by_keyword. content='posts' makes it an external-content
+    # table: it stores only the search index and reads the text from posts.
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+    )
+    fts_exists = cursor.fetchone() is not None
+    cursor.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, content,
+        content='posts', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    ''')
+    
+    # Triggers keep the index in step with every change to posts
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO posts_fts (rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    ''')
+    
+    # A database created before the index existed needs its posts indexed once
+    if not fts_exists:
+        cursor.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+    
+    # Each user's post count is stored on the user row and kept up to date
+    # by triggers, so reading the counts doesn't need to join and group posts.
+    # Databases created before the column existed get it added and filled in once.
+    cursor.execute("SELECT 1 FROM pragma_table_info('users') WHERE name = 'post_count'")
+    if cursor.fetchone() is None:
+        cursor.execute(
+            "ALTER TABLE users ADD COLUMN post_count INTEGER NOT NULL DEFAULT 0"
         )
-        ''')
-        
-        # Create posts table with foreign key reference to users
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            published_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+        cursor.execute(
+            "UPDATE users SET post_count = "
+            "(SELECT COUNT(*) FROM posts WHERE posts.user_id = users.id)"
         )
-        ''')
-        
-        conn.commit()
-        print("Tables created successfully")
-    except sqlite3.Error as e:
-        print(f"Error creating tables: {e}")
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS posts_count_ai AFTER INSERT ON posts BEGIN
+        UPDATE users SET post_count = post_count + 1 WHERE id = new.user_id;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS posts_count_ad AFTER DELETE ON posts BEGIN
+        UPDATE users SET post_count = post_count - 1 WHERE id = old.user_id;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS posts_count_au AFTER UPDATE OF user_id ON posts BEGIN
+        UPDATE users SET post_count = post_count - 1 WHERE id = old.user_id;
+        UPDATE users SET post_count = post_count + 1 WHERE id = new.user_id;
+    END
+    ''')
+    
+    conn.commit()
+    print("Tables created successfully")
 
 # ===============================
 # BASIC SQL OPERATIONS (CRUD)
 # ===============================
 
+# The insert, update and delete functions below don't commit on their own.
+# Wrap them in "with transaction(conn):", so any number of writes share a
+# single commit (and a single disk sync). Inside such a block they raise
+# sqlite3.Error instead of returning None/False/[], so one failed write
+# rolls back the whole block.
+
 # CREATE - Insert operations
 
+@sqlite_guard("Error inserting user",
+              integrity_message="Error: Username '{username}' already exists")
 def insert_user(conn, username, email):
     """
     Insert a new user into the users table.
@@ -105,24 +367,17 @@ def insert_user(conn, username, email):
     Returns:
         int: ID of the newly created user, or None on error
     """
-    try:
-        cursor = conn.cursor()
-        
-        # Use parameterized query to prevent SQL injection
-        cursor.execute(
-            "INSERT INTO users (username, email) VALUES (?, ?)",
-            (username, email)
-        )
-        
-        conn.commit()
-        return cursor.lastrowid
-    except sqlite3.IntegrityError:
-        print(f"Error: Username '{username}' already exists")
-        return None
-    except sqlite3.Error as e:
-        print(f"Error inserting user: {e}")
-        return None
+    cursor = conn.cursor()
+    
+    # Use parameterized query to prevent SQL injection
+    cursor.execute(
+        "INSERT INTO users (username, email) VALUES (?, ?)",
+        (username, email)
+    )
+    
+    return cursor.lastrowid
 
+@sqlite_guard("Error inserting post")
 def insert_post(conn, user_id, title, content):
     """
     Insert a new post for a user.
@@ -136,21 +391,102 @@ def insert_post(conn, user_id, title, content):
     Returns:
         int: ID of the newly created post, or None on error
     """
-    try:
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO posts (user_id, title, content) VALUES (?, ?, ?)",
+        (user_id, title, content)
+    )
+    
+    return cursor.lastrowid
+
+# SQLite allows 999 "?" parameters per statement by default (newer builds allow
+# more), which caps how many rows one multi-row INSERT can carry
+USERS_PER_INSERT = 999 // 2  # 2 columns per user
+POSTS_PER_INSERT = 999 // 3  # 3 columns per post
+
+@sqlite_guard("Error inserting users", default=list,
+              integrity_message="Error: One or more usernames already exist")
+def insert_users_bulk(conn, users, chunk_size=USERS_PER_INSERT):
+    """
+    Insert several users in a single transaction.
+    
+    Each INSERT carries up to chunk_size rows in one VALUES list, so SQLite
+    runs one statement per chunk instead of one per user.
+    
+    Args:
+        conn (sqlite3.Connection): Database connection
+        users (list): (username, email) tuples
+        chunk_size (int): Users per INSERT statement (at most USERS_PER_INSERT)
+        
+    Returns:
+        list: IDs of the new users in the same order, or [] on error
+    """
+    if not users:
+        return []
+    
+    ids = []
+    # One transaction for the whole batch: a single disk sync instead of one per row
+    with transaction(conn):
         cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO posts (user_id, title, content) VALUES (?, ?, ?)",
-            (user_id, title, content)
-        )
+        for start in range(0, len(users), chunk_size):
+            chunk = users[start:start + chunk_size]
+            placeholders = ", ".join(["(?, ?)"] * len(chunk))
+            cursor.execute(
+                f"INSERT INTO users (username, email) VALUES {placeholders} RETURNING id",
+                list(chain.from_iterable(chunk))
+            )
+            # RETURNING doesn't promise an order, but AUTOINCREMENT IDs grow
+            # with each row, so sorting lines them up with the chunk
+            ids.extend(sorted(row[0] for row in cursor.fetchall()))
+    
+    return ids
+
+@sqlite_guard("Error inserting posts", default=list)
+def insert_posts_bulk(conn, posts, chunk_size=POSTS_PER_INSERT):
+    """
+    Insert several posts in a single transaction.
+    
+    Each INSERT carries up to chunk_size rows in one VALUES list, so SQLite
+    runs one statement per chunk instead of one per post.
+    
+    Args:
+        conn (sqlite3.Connection): Database connection
+        posts (list): (user_id, title, content) tuples
+        chunk_size (int): Posts per INSERT statement (at most POSTS_PER_INSERT)
         
-        conn.commit()
-        return cursor.lastrowid
-    except sqlite3.Error as e:
-        print(f"Error inserting post: {e}")
-        return None
+    Returns:
+        list: IDs of the new posts in the same order, or [] on error
+    """
+    if not posts:
+        return []
+    
+    ids = []
+    with transaction(conn):
+        cursor = conn.cursor()
+        for start in range(0, len(posts), chunk_size):
+            chunk = posts[start:start + chunk_size]
+            placeholders = ", ".join(["(?, ?, ?)"] * len(chunk))
+            cursor.execute(
+                f"INSERT INTO posts (user_id, title, content) VALUES {placeholders} RETURNING id",
+                list(chain.from_iterable(chunk))
+            )
+            # RETURNING doesn't promise an order, but AUTOINCREMENT IDs grow
+            # with each row, so sorting lines them up with the chunk
+            ids.extend(sorted(row[0] for row in cursor.fetchall()))
+    
+    return ids
 
 # READ - Select operations
 
+# The read functions name the columns they return instead of using SELECT *,
+# so SQLite and Python only decode the values callers actually use
+USER_COLUMNS = "id, username, email"
+POST_COLUMNS = "id, title, content, published_at"
+SQL_SELECT_USERS = f"SELECT {USER_COLUMNS} FROM users"
+SQL_SELECT_USER_BY_ID = f"SELECT {USER_COLUMNS} FROM users WHERE id = ?"
+SQL_SELECT_POSTS_BY_USER = f"SELECT {POST_COLUMNS} FROM posts WHERE user_id = ?"
+
+@sqlite_guard("Error retrieving users", default=list)
 def get_all_users(conn):
     """
     Retrieve all users from the database.
@@ -159,16 +495,37 @@ def get_all_users(conn):
         conn (sqlite3.Connection): Database connection
         
     Returns:
-        list: List of user dictionaries
+        list: List of user rows (sqlite3.Row) with the USER_COLUMNS fields
+    """
+    cursor = conn.cursor()
+    cursor.execute(SQL_SELECT_USERS)
+    return cursor.fetchall()
+
+def iter_all_users(conn, batch_size=1000):
+    """
+    Yield all users one at a time, reading them from the database in batches.
+    Unlike get_all_users, only batch_size rows are in memory at once, however
+    large the table grows.
+    
+    Args:
+        conn (sqlite3.Connection): Database connection
+        batch_size (int): Number of rows fetched from SQLite per step
+        
+    Yields:
+        sqlite3.Row: User rows with the USER_COLUMNS fields
+        
+    Raises:
+        sqlite3.Error: If the query fails (errors surface while iterating)
     """
+    cursor = conn.cursor()
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users")
-        return [dict(row) for row in cursor.fetchall()]
-    except sqlite3.Error as e:
-        print(f"Error retrieving users: {e}")
-        return []
+        cursor.execute(SQL_SELECT_USERS)
+        while batch := cursor.fetchmany(batch_size):
+            yield from batch
+    finally:
+        cursor.close()
 
+@sqlite_guard("Error retrieving user")
 def get_user_by_id(conn, user_id):
     """
     Retrieve a user by their ID.
@@ -178,17 +535,13 @@ def get_user_by_id(conn, user_id):
         user_id (int): User ID to retrieve
         
     Returns:
-        dict: User data as a dictionary, or None if not found
+        sqlite3.Row: User data (the USER_COLUMNS fields), or None if not found
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        user = cursor.fetchone()
-        return dict(user) if user else None
-    except sqlite3.Error as e:
-        print(f"Error retrieving user: {e}")
-        return None
+    cursor = conn.cursor()
+    cursor.execute(SQL_SELECT_USER_BY_ID, (user_id,))
+    return cursor.fetchone()
 
+@sqlite_guard("Error retrieving posts", default=list)
 def get_posts_by_user(conn, user_id):
     """
     Retrieve all posts by a specific user.
@@ -198,18 +551,15 @@ def get_posts_by_user(conn, user_id):
         user_id (int): User ID to retrieve posts for
         
     Returns:
-        list: List of post dictionaries
+        list: List of post rows (sqlite3.Row) with the POST_COLUMNS fields
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM posts WHERE user_id = ?", (user_id,))
-        return [dict(row) for row in cursor.fetchall()]
-    except sqlite3.Error as e:
-        print(f"Error retrieving posts: {e}")
-        return []
+    cursor = conn.cursor()
+    cursor.execute(SQL_SELECT_POSTS_BY_USER, (user_id,))
+    return cursor.fetchall()
 
 # UPDATE operations
 
+@sqlite_guard("Error updating user", default=False)
 def update_user_email(conn, user_id, new_email):
     """
     Update a user's email address.
@@ -222,20 +572,25 @@ def update_user_email(conn, user_id, new_email):
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE users SET email = ? WHERE id = ?",
-            (new_email, user_id)
-        )
-        conn.commit()
-        
-        # Check if any row was affected
-        return cursor.rowcount > 0
-    except sqlite3.Error as e:
-        print(f"Error updating user: {e}")
-        return False
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE users SET email = ? WHERE id = ?",
+        (new_email, user_id)
+    )
+    
+    # Check if any row was affected
+    return cursor.rowcount > 0
+
+# One fixed statement per combination of fields to update, keyed by
+# (title given, content given). Unlike SQL built on every call, the text is
+# always identical, so the connection's statement cache reuses the parsed query.
+_UPDATE_POST_SQL = {
+    (True, False): "UPDATE posts SET title = ? WHERE id = ?",
+    (False, True): "UPDATE posts SET content = ? WHERE id = ?",
+    (True, True): "UPDATE posts SET title = ?, content = ? WHERE id = ?",
+}
 
+@sqlite_guard("Error updating post", default=False)
 def update_post(conn, post_id, title=None, content=None):
     """
     Update a post's title and/or content.
@@ -249,40 +604,23 @@ def update_post(conn, post_id, title=None, content=None):
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        cursor = conn.cursor()
-        update_parts = []
-        params = []
-        
-        # Build dynamic SQL based on provided parameters
-        if title is not None:
-            update_parts.append("title = ?")
-            params.append(title)
-            
-        if content is not None:
-            update_parts.append("content = ?")
-            params.append(content)
-            
-        if not update_parts:
-            print("No updates specified")
-            return False
-            
-        # Add the post_id to parameters
-        params.append(post_id)
-        
-        # Execute the update
-        query = f"UPDATE posts SET {', '.join(update_parts)} WHERE id = ?"
-        cursor.execute(query, params)
-        conn.commit()
-        
-        # Check if any row was affected
-        return cursor.rowcount > 0
-    except sqlite3.Error as e:
-        print(f"Error updating post: {e}")
+    # Pick the fixed statement for the fields provided, and pass only their values
+    key = (title is not None, content is not None)
+    if key == (False, False):
+        print("No updates specified")
         return False
+    params = [value for value in (title, content) if value is not None]
+    params.append(post_id)
+    
+    cursor = conn.cursor()
+    cursor.execute(_UPDATE_POST_SQL[key], params)
+    
+    # Check if any row was affected
+    return cursor.rowcount > 0
 
 # DELETE operations
 
+@sqlite_guard("Error deleting user", default=False)
 def delete_user(conn, user_id):
     """
     Delete a user from the database.
@@ -295,17 +633,13 @@ def delete_user(conn, user_id):
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        conn.commit()
-        
-        # Check if any row was affected
-        return cursor.rowcount > 0
-    except sqlite3.Error as e:
-        print(f"Error deleting user: {e}")
-        return False
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM users WHERE id = ?", (user_id,))
+    
+    # Check if any row was affected
+    return cursor.rowcount > 0
 
+@sqlite_guard("Error deleting post", default=False)
 def delete_post(conn, post_id):
     """
     Delete a post from the database.
@@ -317,78 +651,107 @@ def delete_post(conn, post_id):
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
-        conn.commit()
-        
-        # Check if any row was affected
-        return cursor.rowcount > 0
-    except sqlite3.Error as e:
-        print(f"Error deleting post: {e}")
-        return False
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+    
+    # Check if any row was affected
+    return cursor.rowcount > 0
 
 # ===============================
 # ADVANCED QUERIES
 # ===============================
 
+@sqlite_guard("Error retrieving user post counts", default=list)
 def get_user_with_posts_count(conn):
     """
     Get all users with a count of how many posts they've made.
-    Demonstrates a JOIN operation.
+    The count is the post_count column that triggers on posts keep up to date.
     
     Args:
         conn (sqlite3.Connection): Database connection
         
     Returns:
-        list: List of dictionaries with user data and post count
+        list: List of rows (sqlite3.Row) with user data and post count
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                u.id, u.username, u.email, COUNT(p.id) as post_count
-            FROM 
-                users u
-            LEFT JOIN 
-                posts p ON u.id = p.user_id
-            GROUP BY 
-                u.id
-        """)
-        return [dict(row) for row in cursor.fetchall()]
-    except sqlite3.Error as e:
-        print(f"Error retrieving user post counts: {e}")
-        return []
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, username, email, post_count FROM users")
+    return cursor.fetchall()
 
+@sqlite_guard("Error retrieving users with posts", default=list)
+def get_all_users_with_posts(conn):
+    """
+    Get every user together with the id and title of each of their posts.
+    Demonstrates avoiding the "N+1 queries" pattern: one JOIN fetches
+    everything, instead of calling get_posts_by_user once per user.
+    
+    Args:
+        conn (sqlite3.Connection): Database connection
+        
+    Returns:
+        list: List of user dictionaries, each with a "posts" list of
+              {"id", "title"} dictionaries (empty for users without posts)
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT 
+            u.id, u.username, p.id AS post_id, p.title
+        FROM 
+            users u
+        LEFT JOIN 
+            posts p ON p.user_id = u.id
+        ORDER BY 
+            u.id, p.id
+    """)
+    # Rows arrive sorted by user, so groupby collects each user's posts
+    # in a single pass
+    users = []
+    for (user_id, username), rows in groupby(cursor, key=lambda row: (row[0], row[1])):
+        posts = [
+            {"id": row["post_id"], "title": row["title"]}
+            for row in rows
+            if row["post_id"] is not None  # LEFT JOIN row for a user with no posts
+        ]
+        users.append({"id": user_id, "username": username, "posts": posts})
+    return users
+
+@sqlite_guard("Error searching posts", default=list)
 def search_posts_by_keyword(conn, keyword):
     """
     Search for posts containing a specific keyword.
-    Demonstrates text search in SQLite.
+    Demonstrates full-text search in SQLite (FTS5).
+    
+    The posts_fts index matches words by prefix, ignoring case and word
+    endings ("tutorials" finds "Tutorial", "SQL" finds "SQLite"), best
+    matches first. Unlike LIKE '%word%', it doesn't have to scan every post.
     
     Args:
         conn (sqlite3.Connection): Database connection
-        keyword (str): Keyword to search for
+        keyword (str): Keyword (or phrase) to search for
         
     Returns:
-        list: List of matching post dictionaries
+        list: List of matching post rows (sqlite3.Row)
     """
-    try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT 
-                p.id, p.title, p.content, p.published_at, 
-                u.username as author
-            FROM 
-                posts p
-            JOIN 
-                users u ON p.user_id = u.id
-            WHERE 
-                p.title LIKE ? OR p.content LIKE ?
-        """, (f'%{keyword}%', f'%{keyword}%'))
-        return [dict(row) for row in cursor.fetchall()]
-    except sqlite3.Error as e:
-        print(f"Error searching posts: {e}")
-        return []
+    # Quote the keyword as an FTS5 phrase, so characters such as - or * in it
+    # are searched for rather than read as query syntax. The trailing * makes
+    # the phrase's last word a prefix token, still looked up in the index.
+    phrase = '"' + keyword.replace('"', '""') + '"*'
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT 
+            p.id, p.title, p.content, p.published_at, 
+            u.username as author
+        FROM 
+            posts_fts f
+        JOIN 
+            posts p ON p.id = f.rowid
+        JOIN 
+            users u ON p.user_id = u.id
+        WHERE 
+            posts_fts MATCH ?
+        ORDER BY 
+            bm25(posts_fts)
+    """, (phrase,))
+    return cursor.fetchall()
 
 # ===============================
 # PRACTICAL EXAMPLE
@@ -404,21 +767,28 @@ def run_demo():
     # Create tables
     create_tables(conn)
     
-    # Create operations - Insert users
+    # Create operations - Insert users (one transaction for the whole batch)
     print("\n=== Creating Users ===")
-    user1_id = insert_user(conn, "john_doe", "john@example.com")
-    user2_id = insert_user(conn, "jane_smith", "jane@example.com")
+    user_ids = insert_users_bulk(conn, [
+        ("john_doe", "john@example.com"),
+        ("jane_smith", "jane@example.com"),
+    ])
+    user1_id, user2_id = user_ids or (None, None)
+    post1_id = post2_id = post3_id = None
     
     if user1_id and user2_id:
         print(f"Created users with IDs: {user1_id}, {user2_id}")
         
-        # Create operations - Insert posts
+        # Create operations - Insert posts (again in a single transaction)
         print("\n=== Creating Posts ===")
-        post1_id = insert_post(conn, user1_id, "Hello World", "My first blog post!")
-        post2_id = insert_post(conn, user1_id, "SQLite Tutorial", "SQLite is a great embedded database.")
-        post3_id = insert_post(conn, user2_id, "Python Programming", "Python is awesome for data analysis.")
+        post_ids = insert_posts_bulk(conn, [
+            (user1_id, "Hello World", "My first blog post!"),
+            (user1_id, "SQLite Tutorial", "SQLite is a great embedded database."),
+            (user2_id, "Python Programming", "Python is awesome for data analysis."),
+        ])
         
-        if post1_id and post2_id and post3_id:
+        if post_ids:
+            post1_id, post2_id, post3_id = post_ids
             print(f"Created posts with IDs: {post1_id}, {post2_id}, {post3_id}")
     
     # Read operations
@@ -436,13 +806,17 @@ def run_demo():
     # Update operations
     if user1_id:
         print("\n=== Updating User ===")
-        if update_user_email(conn, user1_id, "john.doe@newemail.com"):
+        with transaction(conn):
+            updated = update_user_email(conn, user1_id, "john.doe@newemail.com")
+        if updated:
             updated_user = get_user_by_id(conn, user1_id)
             print(f"Updated user email: {updated_user['email']}")
     
     if post1_id:
         print("\n=== Updating Post ===")
-        if update_post(conn, post1_id, content="Updated content for my first blog post!"):
+        with transaction(conn):
+            updated = update_post(conn, post1_id, content="Updated content for my first blog post!")
+        if updated:
             print(f"Successfully updated post {post1_id}")
     
     # Advanced queries
@@ -451,6 +825,11 @@ def run_demo():
     for stat in user_stats:
         print(f"User: {stat['username']}, Posts: {stat['post_count']}")
     
+    print("\n=== Users and Their Posts (one query) ===")
+    for user in get_all_users_with_posts(conn):
+        titles = ", ".join(post["title"] for post in user["posts"]) or "no posts"
+        print(f"User: {user['username']}, Posts: {titles}")
+    
     print("\n=== Posts Containing 'SQLite' ===")
     matching_posts = search_posts_by_keyword(conn, "SQLite")
     for post in matching_posts:
@@ -459,23 +838,37 @@ def run_demo():
     # Delete operations
     if post2_id:
         print("\n=== Deleting Post ===")
-        if delete_post(conn, post2_id):
+        with transaction(conn):
+            deleted = delete_post(conn, post2_id)
+        if deleted:
             print(f"Deleted post {post2_id}")
     
     if user2_id:
         print("\n=== Deleting User ===")
-        if delete_user(conn, user2_id):
+        with transaction(conn):
+            deleted = delete_user(conn, user2_id)
+        if deleted:
             print(f"Deleted user {user2_id} and all their posts")
     
-    # Final user list
+    # Final user list (streamed, so a big table wouldn't be loaded all at once)
     print("\n=== Final User List ===")
-    final_users = get_all_users(conn)
-    for user in final_users:
+    for user in iter_all_users(conn):
         print(f"User ID: {user['id']}, Username: {user['username']}, Email: {user['email']}")
     
     # Close the connection
     conn.close()
     print("\nDatabase connection closed")
+    
+    # Connection pool: writes go through the single writer while readers
+    # (one per thread in a real program) query the same file concurrently
+    if user1_id:
+        print("\n=== Connection Pool ===")
+        pool = SqlitePool("demo.db", readers=2)
+        with pool.writer() as writer:
+            insert_post(writer, user1_id, "Pooled Post", "Written through the pool's writer.")
+        with pool.reader() as reader:
+            print(f"Posts by user {user1_id}: {len(get_posts_by_user(reader, user1_id))}")
+        pool.close()
 
 # Run the demo if this script is executed directly
 if __name__ == "__main__":